@@ -1,32 +1,83 @@
-import praw
+import asyncio
+import asyncpraw
+import asyncprawcore
 import sqlite3
 import time
 import re
 import json
+import string
 import logging
 import sys
-import configparser
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 
 # NEW DEPENDENCIES for Visualization
+# wordcloud imports matplotlib and numpy when loaded, so it is only imported inside the report worker
+# process; here we just check that it (and Pillow, which it installs) is available.
+VISUALIZATION_AVAILABLE = all(importlib.util.find_spec(name) is not None for name in ('wordcloud', 'PIL'))
+if not VISUALIZATION_AVAILABLE:
+    print("Warning: Missing required visualization library (wordcloud). Please install it using: pip install wordcloud")
+
+# OPTIONAL: pyahocorasick scans for all allow-listed tickers in one C-level pass; falls back to TICKER_RE
 try:
-    import matplotlib.pyplot as plt
-    import numpy as np
-    from wordcloud import WordCloud
+    import ahocorasick
 except ImportError:
-    print("Warning: Missing required visualization libraries (matplotlib, numpy, wordcloud). Please install them using: pip install matplotlib numpy wordcloud")
-    # Define dummy functions/classes to allow the rest of the script to run without crashing
-    WordCloud = object
-    plt = None
-    np = None
+    ahocorasick = None
 
 
 # --- 1. CONFIGURATION LOADING ---
 
-config = configparser.ConfigParser()
+_CONFIG_SECTION_RE = re.compile(r'^\s*\[([^\]]+)\]\s*$', re.M)
+# Only spaces/tabs may surround '=' and the value, so an empty value never runs into the next line
+_CONFIG_KEY_RE = re.compile(r'^[ \t]*([^=;#\s]+)[ \t]*=[ \t]*(.*?)[ \t]*$', re.M)
+
+# '%%' (escaped percent), '%(name)s' (reference) or a bare '%', which configparser rejects
+_CONFIG_INTERPOLATION_RE = re.compile(r'%(?:(%)|\(([^)]*)\)s)?')
+
+def _interpolate_config_value(value, options, depth=0):
+    """Expands a value like configparser's default BasicInterpolation: '%%' -> '%', '%(name)s' -> option."""
+    def expand(match):
+        if match.group(1):
+            return '%'
+        if match.group(2) is None:
+            raise ValueError(f"'%' must be followed by '%' or '(name)s' in {value!r}")
+        name = match.group(2).upper()
+        if name not in options:
+            raise ValueError(f"%({match.group(2)})s refers to a missing option in {value!r}")
+        if depth >= 10:
+            raise ValueError(f"Interpolation is nested too deeply in {value!r}")
+        return _interpolate_config_value(options[name], options, depth + 1)
+
+    return _CONFIG_INTERPOLATION_RE.sub(expand, value)
+
+def _load_config(path):
+    """
+    Parses a flat INI file into {section: {KEY: value}}. As with configparser, keys are case-insensitive,
+    [DEFAULT] options are inherited by every section, and '%%' / '%(name)s' are interpolated.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+
+    raw_config = {}
+    headers = list(_CONFIG_SECTION_RE.finditer(text))
+    for i, header in enumerate(headers):
+        end = headers[i + 1].start() if i + 1 < len(headers) else len(text)
+        raw_config.setdefault(header.group(1).strip(), {}).update(
+            (key.upper(), value) for key, value in _CONFIG_KEY_RE.findall(text, header.end(), end)
+        )
+
+    # Like configparser, [DEFAULT] is not a section of its own; its options only fill in the others
+    defaults = raw_config.pop('DEFAULT', {})
+    config = {}
+    for section, options in raw_config.items():
+        options = {**defaults, **options}
+        config[section] = {key: _interpolate_config_value(value, options) for key, value in options.items()}
+    return config
 
 try:
-    config.read('config.ini')
+    config = _load_config('config.ini')
     
     # Load Reddit Secrets
     reddit_config = config['REDDIT_SECRETS']
@@ -38,10 +89,16 @@ try:
 
     # Load App Settings
     app_config = config['APP_SETTINGS']
-    SUBREDDIT_NAME = app_config['SUBREDDIT_NAME']
+    # Several subreddits can be monitored as 'a+b' (or 'a, b'); reddit merges them into one listing per request
+    SUBREDDIT_NAME = '+'.join(name for name in re.split(r'[\s,+]+', app_config['SUBREDDIT_NAME']) if name)
     DB_NAME = app_config['DB_NAME']
     LOG_FILE = app_config['LOG_FILE']
     TICKER_FILTER_FILE = app_config.get('TICKER_FILTER_FILE', 'ticker_allow_list.txt')
+    # Reports with fewer distinct tickers than this are logged instead of rendered as a word cloud
+    MIN_TICKERS_FOR_WC = int(app_config.get('MIN_TICKERS_FOR_WC', '5'))
+
+    # Optional SQLite tuning overrides (the whole section may be omitted)
+    sqlite_config = config.get('SQLITE', {})
 
 except FileNotFoundError:
     logging.critical("ERROR: The 'config.ini' file was not found. Please create it.")
@@ -49,6 +106,9 @@ except FileNotFoundError:
 except KeyError as e:
     logging.critical(f"ERROR: Missing a required key in 'config.ini'. Please add: {e}")
     sys.exit(1)
+except ValueError as e:
+    logging.critical(f"ERROR: Invalid setting in 'config.ini': {e}")
+    sys.exit(1)
 
 
 # Set up logging
@@ -60,15 +120,112 @@ logging.basicConfig(level=logging.INFO,
                     ])
 
 # --- GLOBAL FILTER VARIABLE ---
-ALLOWED_TICKERS_SET = set()
+# Read-only once loaded; load_allowed_tickers() replaces it wholesale
+ALLOWED_TICKERS_SET = frozenset()
+
+# Ticker Extraction RegEx: any-case cashtag (group 1) or bare uppercase 2-5 chars (group 2)
+TICKER_RE = re.compile(r'\$([a-zA-Z]{2,5})\b|\b([A-Z]{2,5})\b')
+
+# Bump to the current time.time() whenever extraction logic or the allow list changes in a way that
+# should be applied retroactively; the analyzer then re-processes every row analyzed before it.
+TICKER_EXTRACTION_VERSION_TS = 0
+
+# Upper bound on rows analyzed per run, so a large catch-up never stalls the event loop for long;
+# any remainder is picked up by the next run
+ANALYSIS_MAX_ROWS_PER_RUN = 500
+
+# The checker re-checks every ACTIVE post created within this many seconds on each run
+CHECK_WINDOW_SECONDS = 86400
+# reddit's info endpoint accepts at most this many fullnames per request
+INFO_BATCH_SIZE = 100
+
+# Aho-Corasick automaton over ALLOWED_TICKERS_SET (None when pyahocorasick is not installed)
+TICKER_AUTOMATON = None
+
+# Length-preserving ASCII-only upper-casing, so automaton match offsets line up with the original text
+_ASCII_UPPER = str.maketrans(string.ascii_lowercase, string.ascii_uppercase)
+
+# SQLite tuning applied to every connection by configure_connection(): WAL lets the checker read while
+# the harvester writes, and synchronous=NORMAL only fsyncs at WAL checkpoints while staying crash-safe.
+# Each value can be overridden from the optional [SQLITE] section of config.ini.
+SQLITE_PRAGMAS = {
+    'journal_mode': sqlite_config.get('JOURNAL_MODE', 'WAL'),
+    'synchronous': sqlite_config.get('SYNCHRONOUS', 'NORMAL'),
+    'temp_store': sqlite_config.get('TEMP_STORE', 'MEMORY'),
+    'mmap_size': sqlite_config.get('MMAP_SIZE', '268435456'), # 256 MB
+    'cache_size': sqlite_config.get('CACHE_SIZE', '-20000'), # ~20 MB
+}
+
+# Size of each connection's prepared-statement cache (sqlite3 keys it on the SQL text)
+SQLITE_CACHED_STATEMENTS = 256
+
+# Writes are grouped into one transaction committed at most every COMMIT_INTERVAL seconds: a crash
+# loses at most that much harvested data, in exchange for one commit instead of one per pillar run.
+# The monitor has a single writer connection, so the last-commit marker is module-wide.
+COMMIT_INTERVAL = 30
+_last_commit = 0.0
+
+# --- HOT-PATH SQL STATEMENTS ---
+# Kept as module constants so every call passes the exact same text and reuses the cached statement.
+
+# INSERT OR IGNORE skips duplicates (where post_id is the primary key)
+SQL_INSERT_THREAD = """
+    INSERT OR IGNORE INTO threads (post_id, title, selftext, author_name, created_utc, 
+                                 initial_score, num_comments_initial, link_flair) 
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Anything we asked about that reddit no longer returns has been deleted/removed
+SQL_FLAG_MISSING_REMOVED = """
+    UPDATE threads 
+    SET status = 'REMOVED', removal_category = 'MOD_OR_USER_REMOVED', removed_utc = ?
+    WHERE status = 'ACTIVE'
+      AND post_id IN (SELECT post_id FROM checked_batch)
+      AND post_id NOT IN (SELECT post_id FROM alive_batch)
+"""
+
+# Still returned by reddit, but flagged as removed by a moderator/automod or deleted
+SQL_FLAG_VISIBLE_REMOVED = """
+    UPDATE threads 
+    SET status = 'REMOVED', removed_utc = ?,
+        removal_category = (SELECT alive_batch.removal_category FROM alive_batch
+                            WHERE alive_batch.post_id = threads.post_id)
+    WHERE status = 'ACTIVE'
+      AND post_id IN (SELECT post_id FROM alive_batch WHERE removal_category IS NOT NULL)
+"""
+
+# Newly REMOVED posts, plus ANALYZED posts whose extraction predates the current extractor
+SQL_STAGE_ANALYSIS_BATCH = """
+    INSERT INTO analysis_batch (post_id)
+    SELECT post_id FROM threads
+    WHERE status = 'REMOVED' OR (status = 'ANALYZED' AND analyzed_at < ?)
+    LIMIT ?
+"""
+
+# extract_tickers() is the SQL function registered by connect_db(), so each row is analyzed in place
+SQL_ANALYZE_BATCH = """
+    UPDATE threads
+    SET extracted_tickers = extract_tickers(title, selftext), status = 'ANALYZED', analyzed_at = ?
+    WHERE post_id IN (SELECT post_id FROM analysis_batch)
+"""
+
+# ticker_mentions holds one row per (analyzed post, ticker), materialized from threads.extracted_tickers
+SQL_CLEAR_BATCH_TICKER_MENTIONS = "DELETE FROM ticker_mentions WHERE post_id IN (SELECT post_id FROM analysis_batch)"
+SQL_MATERIALIZE_TICKER_MENTIONS = """
+    INSERT OR IGNORE INTO ticker_mentions (post_id, ticker, author_name, removed_utc)
+    SELECT threads.post_id, je.value, threads.author_name, threads.removed_utc
+    FROM threads, json_each(threads.extracted_tickers) AS je
+    WHERE threads.status = 'ANALYZED'
+      AND threads.extracted_tickers IS NOT NULL AND json_valid(threads.extracted_tickers)
+"""
 
 
 # --- 2. PRAW & DB SETUP FUNCTIONS ---
 
 def get_reddit_instance():
-    """Initializes and returns the PRAW Reddit instance."""
+    """Initializes and returns the Async PRAW Reddit instance. Must be called from within the event loop."""
     try:
-        reddit = praw.Reddit(
+        reddit = asyncpraw.Reddit(
             client_id=CLIENT_ID,
             client_secret=CLIENT_SECRET,
             user_agent=USER_AGENT,
@@ -83,9 +240,60 @@ def get_reddit_instance():
         logging.error(f"PRAW initialization failed: {e}")
         sys.exit(1)
 
+# Columns added to `threads` after its first release, migrated onto existing databases by initialize_db
+THREADS_ADDED_COLUMNS = {
+    'author_name': 'TEXT',
+    'analyzed_at': 'REAL',
+}
+
+def connect_db():
+    """
+    Opens a SQLite connection in autocommit mode (isolation_level=None), tuned by configure_connection().
+    Plain SELECTs never open a transaction; writes go through write_transaction().
+    """
+    conn = sqlite3.connect(DB_NAME, isolation_level=None, check_same_thread=False,
+                           cached_statements=SQLITE_CACHED_STATEMENTS)
+    configure_connection(conn)
+    conn.create_function("extract_tickers", 2, _extract_tickers_sql, deterministic=True)
+    return conn
+
+def configure_connection(conn):
+    """Applies SQLITE_PRAGMAS to a freshly opened connection."""
+    for pragma, value in SQLITE_PRAGMAS.items():
+        if not re.fullmatch(r'-?\w+', value):
+            logging.error(f"Ignoring invalid SQLite setting {pragma.upper()} = {value!r} in 'config.ini'.")
+            continue
+        conn.execute(f"PRAGMA {pragma} = {value}")
+
+@contextmanager
+def write_transaction(conn):
+    """
+    Runs a block of writes atomically as a SAVEPOINT inside the connection's group transaction
+    (opened with BEGIN IMMEDIATE on first use). Only the block is rolled back if it raises;
+    the group itself is committed by maybe_commit().
+    """
+    if not conn.in_transaction:
+        conn.execute("BEGIN IMMEDIATE")
+    conn.execute("SAVEPOINT write_block")
+    try:
+        yield
+    except BaseException:
+        conn.execute("ROLLBACK TO write_block")
+        conn.execute("RELEASE write_block")
+        raise
+    conn.execute("RELEASE write_block")
+    maybe_commit(conn)
+
+def maybe_commit(conn, force=False):
+    """Commits the open group transaction once COMMIT_INTERVAL has elapsed since the last commit, or when forced."""
+    global _last_commit
+    if conn.in_transaction and (force or time.monotonic() - _last_commit >= COMMIT_INTERVAL):
+        conn.execute("COMMIT")
+        _last_commit = time.monotonic()
+
 def initialize_db():
     """Creates the SQLite database and the threads table if they do not exist."""
-    conn = sqlite3.connect(DB_NAME)
+    conn = connect_db()
     cursor = conn.cursor()
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS threads (
@@ -100,24 +308,94 @@ def initialize_db():
             link_flair TEXT,
             status TEXT DEFAULT 'ACTIVE',
             removal_category TEXT,
-            extracted_tickers TEXT
+            extracted_tickers TEXT,
+            analyzed_at REAL
+        )
+    """)
+    # Databases created by older versions of the script may predate some columns; add any that are missing
+    existing_columns = {row[1] for row in cursor.execute("PRAGMA table_info(threads)")}
+    for column, column_type in THREADS_ADDED_COLUMNS.items():
+        if column not in existing_columns:
+            cursor.execute(f"ALTER TABLE threads ADD COLUMN {column} {column_type}")
+            logging.info(f"Database migration: added column threads.{column}.")
+
+    # Serves the checker's recent-ACTIVE scan and, via its leading column, the analyzer's status lookup.
+    # A partial index (created_utc DESC) WHERE status = 'ACTIVE' is deliberately not used: posts that are
+    # never removed stay ACTIVE forever, so it would be nearly as large as this one while adding a second
+    # index to maintain on every insert for the same lookups.
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_threads_status_created ON threads (status, created_utc DESC)")
+    # Lets the analyzer find rows analyzed before TICKER_EXTRACTION_VERSION_TS without scanning history
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_threads_status_analyzed_at ON threads (status, analyzed_at)")
+    # Report windows: status = 'ANALYZED' AND removed_utc >= ?
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_threads_status_removed ON threads (status, removed_utc)")
+    # Rows analyzed before analyzed_at existed count as analyzed at the epoch
+    cursor.execute("UPDATE threads SET analyzed_at = 0 WHERE status = 'ANALYZED' AND analyzed_at IS NULL")
+
+    # Reports aggregate this narrow table instead of parsing JSON out of the wide threads rows.
+    # It is kept per post rather than per day so rolling windows and unique-author counts stay exact.
+    has_mentions_table = cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'ticker_mentions'").fetchone()
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS ticker_mentions (
+            post_id TEXT,
+            ticker TEXT,
+            author_name TEXT,
+            removed_utc REAL,
+            PRIMARY KEY (post_id, ticker)
+        ) WITHOUT ROWID
+    """)
+    # Covers the report query: removed_utc >= ? GROUP BY ticker, COUNT(DISTINCT author_name)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_ticker_mentions_removed ON ticker_mentions (removed_utc, ticker, author_name)")
+    if not has_mentions_table:
+        cursor.execute(SQL_MATERIALIZE_TICKER_MENTIONS)
+        logging.info(f"Database migration: materialized {cursor.rowcount} ticker mentions from analyzed threads.")
+
+    # Wall-clock time of each report's last run, so a restart does not re-render reports that are not due
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS scheduler_state (
+            name TEXT PRIMARY KEY,
+            last_run REAL
         )
     """)
-    conn.commit()
+
+    # Refresh planner statistics so the status indexes are chosen once the tables have grown
+    cursor.execute("ANALYZE threads")
+    cursor.execute("ANALYZE ticker_mentions")
     conn.close()
     logging.info(f"Database '{DB_NAME}' initialized successfully.")
 
+def load_scheduler_state(conn):
+    """Returns {name: last_run} for every scheduled job that has recorded a run."""
+    return dict(conn.execute("SELECT name, last_run FROM scheduler_state"))
+
+def save_scheduler_run(conn, name, run_utc):
+    """Records that the scheduled job `name` last ran at run_utc."""
+    with write_transaction(conn):
+        conn.execute("INSERT OR REPLACE INTO scheduler_state (name, last_run) VALUES (?, ?)", (name, run_utc))
+
 def load_allowed_tickers(filter_filepath):
     """Loads the external list of pre-approved, high-cap tickers."""
-    global ALLOWED_TICKERS_SET
+    global ALLOWED_TICKERS_SET, TICKER_AUTOMATON
     try:
         with open(filter_filepath, 'r', encoding='utf-8') as f:
-            ALLOWED_TICKERS_SET = {line.strip().upper() for line in f if line.strip()}
+            ALLOWED_TICKERS_SET = frozenset(line.strip().upper() for line in f if line.strip())
         
         if not ALLOWED_TICKERS_SET:
             logging.warning("WARNING: Ticker Allow List is EMPTY. All extracted tickers will be rejected.")
         else:
             logging.info(f"Loaded {len(ALLOWED_TICKERS_SET)} verified tickers for filtering.")
+
+        # TICKER_RE only produces 2-5 letter candidates, so other entries (e.g. 'F', 'BRK.B') can never match;
+        # the automaton leaves them out too, keeping both extraction paths identical
+        matchable_tickers = [ticker for ticker in ALLOWED_TICKERS_SET if re.fullmatch(r'[A-Z]{2,5}', ticker)]
+        if len(matchable_tickers) < len(ALLOWED_TICKERS_SET):
+            logging.warning(f"Ticker Allow List: {len(ALLOWED_TICKERS_SET) - len(matchable_tickers)} entries are not 2-5 letter tickers and will never match.")
+
+        if ahocorasick is not None and matchable_tickers:
+            TICKER_AUTOMATON = ahocorasick.Automaton()
+            for ticker in matchable_tickers:
+                TICKER_AUTOMATON.add_word(ticker, ticker)
+            TICKER_AUTOMATON.make_automaton()
             
     except FileNotFoundError:
         logging.critical(f"FATAL: Ticker filter file not found at path: {filter_filepath}. Analysis cannot be performed accurately.")
@@ -127,161 +405,245 @@ def load_allowed_tickers(filter_filepath):
     return ALLOWED_TICKERS_SET
 
 
-# --- 3. HARVESTER FUNCTION ---
+# --- 3. HARVESTER FUNCTIONS ---
+
+def _submission_row(submission):
+    """Builds the SQL_INSERT_THREAD parameter tuple for a submission."""
+    # The listing payload already carries the author's name; PRAW builds a lazy Redditor from it
+    # without a fetch. Deleted accounts come back as None.
+    author = getattr(submission, 'author', None)
+    author = author.name if author is not None else "[Deleted]"
+    link_flair = submission.link_flair_text or ""
+
+    return (
+        submission.id,
+        submission.title,
+        submission.selftext or "", 
+        author,
+        submission.created_utc,
+        submission.score,
+        submission.num_comments,
+        link_flair
+    )
+
+def _insert_threads(conn, rows):
+    """Inserts harvested rows in one transaction and returns how many were new."""
+    changes_before = conn.total_changes
+
+    # One prepared statement and one transaction for the whole batch
+    with write_transaction(conn):
+        conn.executemany(SQL_INSERT_THREAD, rows)
 
-def harvest_new_threads(reddit, subreddit_name, conn):
+    return conn.total_changes - changes_before
+
+async def harvest_new_threads(subreddit, conn):
     """
-    Pillar 1: Fetches new posts and inserts them into the database.
+    Pillar 1 (backfill): Fetches the newest 100 posts and inserts any the stream has not delivered.
+    A submission that cannot be read is skipped; a network/API failure part-way through the listing
+    still commits the posts pulled so far before the error reaches the scheduler.
     """
-    logging.info(f"Starting Harvester on r/{subreddit_name}...")
-    subreddit = reddit.subreddit(subreddit_name)
-    cursor = conn.cursor()
-    
-    pulled_count = 0
-    total_inserted = 0
+    logging.info(f"Starting Harvester on r/{subreddit.display_name}...")
     
+    rows = []
+    skipped = 0
+
     try:
-        for submission in subreddit.new(limit=100):
-            pulled_count += 1
-            
-            author = submission.author.name if submission.author else "[Deleted]"
-            link_flair = submission.link_flair_text or ""
-
-            data = (
-                submission.id,
-                submission.title,
-                submission.selftext or "", 
-                author,
-                submission.created_utc,
-                submission.score,
-                submission.num_comments,
-                link_flair
-            )
-
-            # Use INSERT OR IGNORE to skip duplicates (where post_id is the primary key)
-            cursor.execute("""
-                INSERT OR IGNORE INTO threads (post_id, title, selftext, author_name, created_utc, 
-                                             initial_score, num_comments_initial, link_flair) 
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, data)
-            
-            if cursor.rowcount > 0:
-                total_inserted += 1
+        async for submission in subreddit.new(limit=100):
+            try:
+                rows.append(_submission_row(submission))
+            except (asyncpraw.exceptions.AsyncPRAWException, AttributeError) as e:
+                skipped += 1
+                logging.warning(f"Harvester: Skipping submission {getattr(submission, 'id', '?')}: {e}")
+
+    except BaseException:
+        # Keep what was pulled before the failure (or cancellation), then let the scheduler handle it
+        total_inserted = _insert_threads(conn, rows) if rows else 0
+        logging.warning(f"Harvester interrupted: Inserted {total_inserted} new unique threads from the {len(rows)} posts pulled before the error.")
+        raise
+
+    total_inserted = _insert_threads(conn, rows) if rows else 0
+    logging.info(f"Harvester finished: Pulled {len(rows)} posts from API. Inserted {total_inserted} new unique threads (duplicates ignored).")
+    if skipped:
+        logging.warning(f"Harvester: Skipped {skipped} unreadable submissions.")
+
+async def stream_new_threads(subreddit, queue):
+    """
+    Pillar 1 (stream): Follows the subreddit's submission stream and queues each new post as it arrives.
+    Returns on error so the scheduler can reconnect it after a pause; API and network errors reach the
+    scheduler, which backs off before reconnecting.
+    """
+    logging.info(f"Starting submission stream on r/{subreddit.display_name}...")
 
-        conn.commit()
-        logging.info(f"Harvester finished: Pulled {pulled_count} posts from API. Inserted {total_inserted} new unique threads (duplicates ignored).")
-        
+    try:
+        async for submission in subreddit.stream.submissions(skip_existing=True):
+            queue.put_nowait(_submission_row(submission))
+
+    except (asyncpraw.exceptions.RedditAPIException, asyncprawcore.exceptions.AsyncPrawcoreException):
+        raise
     except Exception as e:
-        logging.error(f"Harvester error: {e}")
-        conn.rollback()
+        logging.error(f"Submission stream error: {e}")
+
+def flush_streamed_threads(queue, conn):
+    """Drains the stream queue into the database as a single batch."""
+    rows = []
+    while not queue.empty():
+        rows.append(queue.get_nowait())
+
+    if rows:
+        total_inserted = _insert_threads(conn, rows)
+        logging.info(f"Stream flush: Inserted {total_inserted} of {len(rows)} streamed threads.")
 
 # --- 4. CHECKER FUNCTION ---
 
-def check_for_deletions(reddit, conn):
+async def check_for_deletions(reddit, conn):
     """
-    Pillar 3: Checks currently ACTIVE posts for removal/deletion using the info endpoint.
+    Pillar 3: Checks ACTIVE posts from the last CHECK_WINDOW_SECONDS for removal/deletion using the
+    info endpoint, INFO_BATCH_SIZE posts per request. Each batch is written as soon as it returns, so
+    an error part-way through keeps the results of the batches already checked. API and network errors
+    reach the scheduler, which backs off before the next run.
     """
     logging.info("Starting Checker for deletions...")
     cursor = conn.cursor()
     
-    # Select up to 100 ACTIVE post IDs to check, prioritized by newest
-    cursor.execute("SELECT post_id FROM threads WHERE status = 'ACTIVE' ORDER BY created_utc DESC LIMIT 100")
-    active_ids = [f"t3_{row[0]}" for row in cursor.fetchall()]
+    # Per-connection scratch tables for the checked batch and the posts reddit still returns
+    cursor.execute("CREATE TEMP TABLE IF NOT EXISTS checked_batch (post_id TEXT PRIMARY KEY)")
+    cursor.execute("CREATE TEMP TABLE IF NOT EXISTS alive_batch (post_id TEXT PRIMARY KEY, removal_category TEXT)")
+
+    # ACTIVE posts inside the window, newest first, with SQL building their fullnames
+    cursor.execute("""
+        SELECT post_id, 't3_' || post_id FROM threads
+        WHERE status = 'ACTIVE' AND created_utc >= ?
+        ORDER BY created_utc DESC
+    """, (time.time() - CHECK_WINDOW_SECONDS,))
+    active_posts = cursor.fetchall()
 
-    if not active_ids:
+    if not active_posts:
         logging.info("Checker: No active posts to check.")
         return
 
+    flagged_count = 0
     try:
-        active_submissions = list(reddit.info(fullnames=active_ids))
-        returned_ids = {sub.fullname for sub in active_submissions}
-        deleted_ids = set(active_ids) - returned_ids
-
-        if deleted_ids:
-            bare_deleted_ids = tuple([post_fullname.split('_', 1)[1] for post_fullname in deleted_ids])
-            deleted_placeholders = ','.join('?' * len(bare_deleted_ids))
-            current_utc = time.time()
-            
-            cursor.execute(f"""
-                UPDATE threads 
-                SET status = 'REMOVED', removal_category = 'MOD_OR_USER_REMOVED', removed_utc = {current_utc}
-                WHERE post_id IN ({deleted_placeholders})
-            """, bare_deleted_ids)
-            
-            logging.warning(f"Checker: Found and flagged {len(bare_deleted_ids)} deleted/removed posts.")
+        for i in range(0, len(active_posts), INFO_BATCH_SIZE):
+            batch = active_posts[i:i + INFO_BATCH_SIZE]
+
+            # One pass over the returned posts; removal_category is only kept for visible-but-removed posts
+            alive_rows = []
+            missing_category_count = 0
+            async for sub in reddit.info(fullnames=[fullname for _, fullname in batch]):
+                # Read the fields the listing returned from sub.__dict__, so a post whose listing omitted
+                # removed_by_category can be counted rather than silently treated as not removed
+                if 'removed_by_category' not in sub.__dict__:
+                    missing_category_count += 1
+                removal_status = sub.__dict__.get('removed_by_category')
+                if removal_status not in ('moderator', 'deleted', 'automoderator'):
+                    removal_status = None
+                alive_rows.append((sub.id, removal_status))
+
+            if missing_category_count:
+                logging.warning(f"Checker: {missing_category_count} returned posts had no removed_by_category field.")
+
+            with write_transaction(conn):
+                current_utc = time.time()
+                cursor.execute("DELETE FROM checked_batch")
+                cursor.executemany("INSERT INTO checked_batch (post_id) VALUES (?)", [(post_id,) for post_id, _ in batch])
+                cursor.execute("DELETE FROM alive_batch")
+                cursor.executemany("INSERT OR IGNORE INTO alive_batch (post_id, removal_category) VALUES (?, ?)", alive_rows)
+
+                # Anything we asked about that reddit no longer returns has been deleted/removed
+                cursor.execute(SQL_FLAG_MISSING_REMOVED, (current_utc,))
+                flagged_count += cursor.rowcount
+
+                # Still returned by reddit, but flagged as removed by a moderator/automod or deleted
+                cursor.execute(SQL_FLAG_VISIBLE_REMOVED, (current_utc,))
+
+        if flagged_count > 0:
+            logging.warning(f"Checker: Found and flagged {flagged_count} deleted/removed posts.")
 
-        for sub in active_submissions:
-            removal_status = getattr(sub, 'removed_by_category', None)
-            if removal_status in ('moderator', 'deleted', 'automoderator'):
-                cursor.execute("""
-                    UPDATE threads SET status = 'REMOVED', removal_category = ?, removed_utc = ? 
-                    WHERE post_id = ?
-                """, (removal_status, time.time(), sub.id))
-
-        conn.commit()
-        
         cursor.execute("SELECT COUNT(post_id) FROM threads WHERE status != 'ACTIVE'")
         total_deleted = cursor.fetchone()[0]
-        logging.info(f"Checker finished. Total deleted threads in DB: {total_deleted}")
+        logging.info(f"Checker finished. Checked {len(active_posts)} active posts. Total deleted threads in DB: {total_deleted}")
 
+    except (asyncpraw.exceptions.RedditAPIException, asyncprawcore.exceptions.AsyncPrawcoreException):
+        raise
     except Exception as e:
         logging.error(f"Checker error: {e}")
-        conn.rollback()
 
 # --- 5. ANALYSIS FUNCTION ---
 
+def _is_word_char(char):
+    return char.isalnum() or char == '_'
+
+def extract_tickers(text):
+    """
+    Returns the allow-listed tickers mentioned in text, either as a bare uppercase word or as a
+    $cashtag in any case -- the same matches TICKER_RE produces, filtered by ALLOWED_TICKERS_SET.
+    """
+    if TICKER_AUTOMATON is None:
+        # Validation: Only keep tickers found in the pre-approved list
+        return {
+            ticker for ticker in (bare or cashtag.upper() for cashtag, bare in TICKER_RE.findall(text))
+            if ticker in ALLOWED_TICKERS_SET
+        }
+
+    found = set()
+    for end, ticker in TICKER_AUTOMATON.iter(text.translate(_ASCII_UPPER)):
+        start = end - len(ticker) + 1
+        end += 1
+        # The automaton matches substrings; keep whole words only
+        if end < len(text) and _is_word_char(text[end]):
+            continue
+        if start > 0 and text[start - 1] == '$':
+            found.add(ticker)
+        elif (start == 0 or not _is_word_char(text[start - 1])) and text[start:end] == ticker:
+            found.add(ticker)
+    return found
+
+def _extract_tickers_sql(title, selftext):
+    """SQL function extract_tickers(title, selftext): the verified tickers as a JSON array, or NULL if none."""
+    verified_tickers = extract_tickers(f"{title} {selftext}")
+    return json.dumps(list(verified_tickers)) if verified_tickers else None
+
 def analyze_removed_threads(conn):
     """
     Pillar 4: Analyzes threads marked as 'REMOVED' for tickers and updates status.
-    Filters extracted tickers against the global ALLOWED_TICKERS_SET.
+    Filters extracted tickers against the global ALLOWED_TICKERS_SET. Threads analyzed before
+    TICKER_EXTRACTION_VERSION_TS are re-analyzed once.
     """
     logging.info("Starting Analysis for removed threads...")
     cursor = conn.cursor()
 
-    cursor.execute("SELECT post_id, title, selftext FROM threads WHERE status = 'REMOVED'")
-    removed_posts = cursor.fetchall()
-
-    if not removed_posts:
-        logging.info("Analysis: No removed posts found to analyze.")
-        return
-        
     if not ALLOWED_TICKERS_SET:
         logging.warning("Analysis skipped: The ALLOWED_TICKERS_SET is empty. Cannot filter candidates.")
         return
 
-    # Ticker Extraction RegEx
-    TICKER_REGEX = r'(?:\b[A-Z]{2,5}\b|\$[a-zA-Z]{2,5}\b)' # Adjusted to 2-5 chars for more coverage
-    
-    analyzed_count = 0
-    
-    for post_id, title, selftext in removed_posts:
-        full_text = f"{title} {selftext}"
-        
-        raw_candidates = re.findall(TICKER_REGEX, full_text)
-        
-        verified_tickers = set()
-        
-        for t in raw_candidates:
-            cleaned_ticker = t.lstrip('$').upper()
-            
-            # Validation: Only keep tickers found in the pre-approved list
-            if cleaned_ticker in ALLOWED_TICKERS_SET:
-                verified_tickers.add(cleaned_ticker)
-        
-        if verified_tickers:
-            tickers_json = json.dumps(list(verified_tickers))
-            
-            cursor.execute("""
-                UPDATE threads 
-                SET extracted_tickers = ?, status = 'ANALYZED'
-                WHERE post_id = ?
-            """, (tickers_json, post_id))
-            analyzed_count += 1
-        else:
-            cursor.execute("UPDATE threads SET status = 'ANALYZED' WHERE post_id = ?", (post_id,))
+    # Per-connection scratch table for the post IDs analyzed in this run
+    cursor.execute("CREATE TEMP TABLE IF NOT EXISTS analysis_batch (post_id TEXT PRIMARY KEY)")
+
+    # Stage, extract and materialize the batch as a single transaction: the text is handed straight
+    # from SQLite to the extract_tickers() SQL function and never round-trips through Python rows
+    with write_transaction(conn):
+        cursor.execute("DELETE FROM analysis_batch")
+        cursor.execute(SQL_STAGE_ANALYSIS_BATCH, (TICKER_EXTRACTION_VERSION_TS, ANALYSIS_MAX_ROWS_PER_RUN))
+        scanned_count = cursor.rowcount
 
-    conn.commit()
+        if scanned_count:
+            cursor.execute(SQL_ANALYZE_BATCH, (time.time(),))
+            # Re-analyzed posts may have gained or lost tickers, so replace their mentions outright
+            cursor.execute(SQL_CLEAR_BATCH_TICKER_MENTIONS)
+            cursor.execute(SQL_MATERIALIZE_TICKER_MENTIONS + " AND threads.post_id IN (SELECT post_id FROM analysis_batch)")
+
+    if not scanned_count:
+        logging.info("Analysis: No removed posts found to analyze.")
+        return
+
+    cursor.execute("""
+        SELECT COUNT(*) FROM threads
+        WHERE post_id IN (SELECT post_id FROM analysis_batch) AND extracted_tickers IS NOT NULL
+    """)
+    analyzed_count = cursor.fetchone()[0]
     logging.info(f"Analysis finished. {analyzed_count} threads had verified tickers extracted.")
+    if scanned_count >= ANALYSIS_MAX_ROWS_PER_RUN:
+        logging.info(f"Analysis: Reached the {ANALYSIS_MAX_ROWS_PER_RUN}-row limit; the remaining backlog will be analyzed next run.")
 
 # --- 6. REPORTING AND VISUALIZATION FUNCTIONS ---
 
@@ -292,40 +654,20 @@ def calculate_weighted_scores(conn, start_utc):
     """
     cursor = conn.cursor()
     
-    # Query to fetch all analyzed tickers and their authors within the time window
+    # 1. Total Mentions Count and 2. Unique Author Count, aggregated per ticker inside SQLite
+    # from the materialized ticker_mentions table (one row per analyzed post and ticker).
+    # idx_ticker_mentions_removed covers the query, so the wide threads rows are never read.
+    # COUNT(DISTINCT) skips NULLs, so rows migrated without an author_name add one "unknown" author,
+    # and every ticker that has a mention also scores at least 1.
     cursor.execute("""
-        SELECT extracted_tickers, author_name 
-        FROM threads 
-        WHERE status = 'ANALYZED' AND removed_utc >= ? AND extracted_tickers IS NOT NULL
+        SELECT ticker, COUNT(*), COUNT(DISTINCT author_name) + MAX(author_name IS NULL)
+        FROM ticker_mentions
+        WHERE removed_utc >= ?
+        GROUP BY ticker
     """, (start_utc,))
-    
-    results = cursor.fetchall()
-
-    ticker_mentions = {}
-    ticker_unique_authors = {}
-    
-    for tickers_json, author_name in results:
-        try:
-            # Safely load the JSON array of tickers
-            tickers = json.loads(tickers_json)
-        except (TypeError, json.JSONDecodeError):
-            continue
-
-        for ticker in tickers:
-            # 1. Total Mentions Count
-            ticker_mentions[ticker] = ticker_mentions.get(ticker, 0) + 1
-            
-            # 2. Unique Author Count
-            if ticker not in ticker_unique_authors:
-                ticker_unique_authors[ticker] = set()
-            ticker_unique_authors[ticker].add(author_name)
 
     # 3. Calculate Final Weighted Score: Mentions * Unique Authors Count
-    weighted_scores = {}
-    for ticker, count in ticker_mentions.items():
-        unique_authors_count = len(ticker_unique_authors[ticker])
-        weighted_score = count * unique_authors_count
-        weighted_scores[ticker] = weighted_score
+    weighted_scores = {ticker: mentions * unique_authors for ticker, mentions, unique_authors in cursor}
         
     return weighted_scores
 
@@ -335,7 +677,7 @@ def generate_word_cloud_report(conn, time_window_seconds, timeframe_label):
     Generates and saves a weighted word cloud visualization.
     """
     
-    if plt is None or WordCloud is object:
+    if not VISUALIZATION_AVAILABLE:
         logging.error("Reporting failed: Missing visualization dependencies.")
         return
 
@@ -349,9 +691,19 @@ def generate_word_cloud_report(conn, time_window_seconds, timeframe_label):
         logging.info(f"Report ({timeframe_label}): No analyzed data found for the last {timeframe_label} window.")
         return
 
-    # 2. Generate the Word Cloud
+    # A handful of words makes a meaningless cloud and an expensive layout; log the scores instead
+    if len(weighted_scores) < MIN_TICKERS_FOR_WC:
+        top_scores = sorted(weighted_scores.items(), key=lambda item: item[1], reverse=True)
+        logging.info(f"Report ({timeframe_label}): Only {len(weighted_scores)} tickers, skipping word cloud. Scores: {top_scores}")
+        return
+
+    # Deferred so matplotlib/numpy are only loaded by the process that renders reports
+    from wordcloud import WordCloud
+    from PIL import Image, ImageDraw, ImageFont
+
+    # 2. Generate the Word Cloud (sparse reports get a proportionally narrower canvas)
     wc = WordCloud(
-        width=1000, 
+        width=min(1000, 200 * len(weighted_scores)), 
         height=600, 
         background_color="white", 
         colormap='viridis',
@@ -367,45 +719,111 @@ def generate_word_cloud_report(conn, time_window_seconds, timeframe_label):
     timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"wordcloud reports/{timeframe_label.lower()}_{timestamp_str}.png"
     
-    # Use Matplotlib to add a title and save
-    plt.figure(figsize=(10, 6))
-    plt.imshow(wc, interpolation="bilinear")
-    plt.axis("off")
-    plt.title(f"Deleted Ticker Activity - Last {timeframe_label} (Weighted by Unique Users)", fontsize=16)
+    # Add the title in a band above the cloud, shrinking it to fit narrow canvases
+    cloud = wc.to_image()
+    title = f"Deleted Ticker Activity - Last {timeframe_label} (Weighted by Unique Users)"
+    font_size = 20
+    font = ImageFont.truetype(wc.font_path, font_size)
+    while font_size > 8 and font.getlength(title) > cloud.width - 20:
+        font_size -= 1
+        font = ImageFont.truetype(wc.font_path, font_size)
+
+    image = Image.new("RGB", (cloud.width, cloud.height + 40), "white")
+    image.paste(cloud, (0, 40))
+    ImageDraw.Draw(image).text((cloud.width // 2, 20), title, fill="black", font=font, anchor="mm")
     
     try:
-        plt.savefig(filename, bbox_inches='tight')
-        plt.close()
+        image.save(filename, optimize=True)
         logging.info(f"Report generated successfully: {filename}")
     except Exception as e:
         logging.error(f"Error saving word cloud image: {e}")
 
 
+def generate_word_cloud_report_worker(db_name, time_window_seconds, timeframe_label):
+    """
+    Entry point in the report worker process. Opens its own read-only connection, so rendering
+    never touches the main loop's connection or open group transaction.
+    """
+    conn = sqlite3.connect(f'file:{db_name}?mode=ro', uri=True)
+    try:
+        generate_word_cloud_report(conn, time_window_seconds, timeframe_label)
+    finally:
+        conn.close()
+
+
+async def render_report_in_worker(executor, conn, time_window_seconds, timeframe_label):
+    """
+    Renders a report in the worker process. WordCloud layout and PNG encoding hold the GIL for
+    hundreds of ms, so a thread would still stall the pillars; a process does not.
+    The run is then recorded in scheduler_state under timeframe_label.
+    """
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(executor, generate_word_cloud_report_worker,
+                               DB_NAME, time_window_seconds, timeframe_label)
+    save_scheduler_run(conn, timeframe_label, time.time())
+
+
 # --- 7. MAIN LOOP (WITH REPORT SCHEDULING) ---
 
-def main_loop(reddit):
-    """Manages the scheduling and execution of the three pillars and reporting."""
-    
-    # Timing markers (in seconds since epoch)
-    last_harvest = 0
-    last_check = 0
-    last_analysis = 0
-    
-    # Report timing markers
-    last_report_hourly = 0
-    last_report_daily_1 = 0 # First daily run (e.g., mid-day)
-    last_report_daily_2 = 0 # Second daily run (e.g., mid-night)
-    last_report_weekly = 0
+def seconds_until_due(last_runs, name, interval):
+    """Delay before `name` is next due: `interval` seconds after its recorded last run, or now if it never ran."""
+    return max(0, last_runs.get(name, 0) + interval - time.time())
+
+async def run_periodically(label, interval, func, *args, initial_delay=0):
+    """
+    Runs func(*args) every `interval` seconds, awaiting it when it is a coroutine function.
+    Runs are anchored to absolute time.monotonic() deadlines, so the pillar's own run time does
+    not push the schedule back and wall-clock jumps do not affect it.
+    PRAW API and network errors back off exponentially; database errors are retried; anything else propagates.
+    """
+    next_run = time.monotonic() + initial_delay
+    backoff = 60
+
+    while True:
+        await asyncio.sleep(max(0, next_run - time.monotonic()))
+
+        try:
+            result = func(*args)
+            if asyncio.iscoroutine(result):
+                await result
+            backoff = 60
+
+        except (asyncpraw.exceptions.RedditAPIException, asyncprawcore.exceptions.AsyncPrawcoreException) as e:
+            logging.error(f"{label}: PRAW API Rate Limit Hit or Error: {e}. Sleeping for {backoff} seconds.")
+            next_run = time.monotonic() + backoff
+            backoff = min(backoff * 2, 900)
+            continue
+
+        except sqlite3.Error as e:
+            logging.error(f"{label}: Database Error: {e}. Will retry in 10 seconds.")
+            next_run = time.monotonic() + 10
+            continue
+
+        next_run += interval
+        # If a run overshot a whole interval, start again from now rather than firing a catch-up burst
+        if next_run < time.monotonic():
+            next_run = time.monotonic() + interval
+
+
+async def main_loop():
+    """
+    Runs the three pillars and the reports as concurrent asyncio tasks, each on its own interval,
+    so the checker no longer waits behind a harvest (or vice versa) while PRAW is on the network.
+    All tasks share one SQLite connection: no pillar awaits inside a write_transaction() block, so
+    transactions never interleave. Reports render in a single worker process and read the last
+    committed data through their own connection.
+    """
 
     # Target intervals (in seconds)
-    HARVEST_INTERVAL = 1
+    HARVEST_INTERVAL = 120 # Backfill only; new posts arrive through the stream
+    STREAM_FLUSH_INTERVAL = 5
+    STREAM_RECONNECT_INTERVAL = 30
     CHECK_INTERVAL = 30 
     ANALYSIS_INTERVAL = 60 # 30 min 
     
     # REPORTING INTERVALS
     REPORT_HOURLY_INTERVAL = 3600 # 1 hour
-    REPORT_DAILY_INTERVAL_1 = 43200 # 12 hours (For the two overlapping 24hr runs)
-    REPORT_DAILY_INTERVAL_2 = 43200 # 12 hours (For the two overlapping 24hr runs)
+    REPORT_DAILY_INTERVAL = 43200 # 12 hours (24hr window; the hourly report covers intra-day freshness)
     REPORT_WEEKLY_INTERVAL = 86400 # 24 hours
 
     # Time windows for the reports (in seconds)
@@ -413,89 +831,64 @@ def main_loop(reddit):
     WINDOW_DAILY = 86400 # 24 hours
     WINDOW_WEEKLY = 604800 # 7 days
     
+    reddit = get_reddit_instance()
     conn = None 
+    tasks = []
+    report_executor = ProcessPoolExecutor(max_workers=1)
 
     try:
-        while True:
-            current_time = time.time()
-            
-            try:
-                if conn is None:
-                    logging.info("Establishing database connection...")
-                    conn = sqlite3.connect(DB_NAME)
-                    logging.info("Database connection successful.")
-
-                # --- Core Pillars ---
-                if current_time - last_harvest >= HARVEST_INTERVAL:
-                    harvest_new_threads(reddit, SUBREDDIT_NAME, conn)
-                    last_harvest = current_time
-
-                if current_time - last_check >= CHECK_INTERVAL:
-                    check_for_deletions(reddit, conn)
-                    last_check = current_time
-                
-                if current_time - last_analysis >= ANALYSIS_INTERVAL:
-                    analyze_removed_threads(conn)
-                    last_analysis = current_time
-                
-                # --- Reporting Scheduling (Hourly, Daily, Weekly) ---
-
-                # 1. Hourly Report (Last 60 minutes) - Runs every hour
-                if current_time - last_report_hourly >= REPORT_HOURLY_INTERVAL:
-                    generate_word_cloud_report(conn, WINDOW_HOURLY, "Hourly")
-                    last_report_hourly = current_time
-
-                # 2. Daily Report 1 (Last 24 hours) - Runs every 12 hours
-                if current_time - last_report_daily_1 >= REPORT_DAILY_INTERVAL_1:
-                    generate_word_cloud_report(conn, WINDOW_DAILY, "Daily_Run1")
-                    last_report_daily_1 = current_time
-                    
-                # 3. Daily Report 2 (Last 24 hours) - Runs every 12 hours, offset by 6 hours from Run 1
-                if current_time - last_report_daily_2 >= REPORT_DAILY_INTERVAL_2 and (current_time - last_report_daily_1) > (REPORT_DAILY_INTERVAL_1 / 2):
-                    generate_word_cloud_report(conn, WINDOW_DAILY, "Daily_Run2")
-                    last_report_daily_2 = current_time
-
-                # 4. Weekly Report (Last 7 days) - Runs once a day
-                if current_time - last_report_weekly >= REPORT_WEEKLY_INTERVAL:
-                    generate_word_cloud_report(conn, WINDOW_WEEKLY, "Weekly")
-                    last_report_weekly = current_time
-
-
-                # --- Sleep Logic ---
-                sleep_time = min(
-                    HARVEST_INTERVAL - (current_time - last_harvest),
-                    CHECK_INTERVAL - (current_time - last_check),
-                    ANALYSIS_INTERVAL - (current_time - last_analysis),
-                    REPORT_HOURLY_INTERVAL - (current_time - last_report_hourly),
-                    REPORT_DAILY_INTERVAL_1 - (current_time - last_report_daily_1),
-                    REPORT_WEEKLY_INTERVAL - (current_time - last_report_weekly),
-                    10 # Cap the sleep time for responsiveness
-                )
-                
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
-
-            except praw.exceptions.APIException as e:
-                logging.error(f"PRAW API Rate Limit Hit or Error: {e}. Sleeping for 60 seconds.")
-                time.sleep(60)
-            
-            except sqlite3.Error as e:
-                logging.error(f"Database Error: {e}. Closing connection and will retry.")
-                if conn:
-                    conn.close()
-                conn = None 
-                time.sleep(10) 
-            
-            except Exception as e:
-                logging.critical(f"A critical unhandled error occurred: {e}. Exiting script.")
-                break 
+        logging.info("Establishing database connection...")
+        conn = connect_db()
+        logging.info("Database connection successful.")
+
+        # Build the Subreddit wrapper once; it is lazy and safe to reuse across harvests
+        subreddit = await reddit.subreddit(SUBREDDIT_NAME)
+        # Streamed submissions wait here until the next flush writes them in one batch
+        stream_queue = asyncio.Queue()
+        # Reports resume their cadence across restarts instead of all firing at startup
+        last_report_runs = load_scheduler_state(conn)
+
+        tasks = [
+            # --- Core Pillars ---
+            asyncio.create_task(run_periodically("Submission stream", STREAM_RECONNECT_INTERVAL,
+                                                 stream_new_threads, subreddit, stream_queue)),
+            asyncio.create_task(run_periodically("Stream flush", STREAM_FLUSH_INTERVAL,
+                                                 flush_streamed_threads, stream_queue, conn)),
+            asyncio.create_task(run_periodically("Harvester", HARVEST_INTERVAL, harvest_new_threads, subreddit, conn)),
+            asyncio.create_task(run_periodically("Checker", CHECK_INTERVAL, check_for_deletions, reddit, conn)),
+            asyncio.create_task(run_periodically("Analysis", ANALYSIS_INTERVAL, analyze_removed_threads, conn)),
+            # Commits the group transaction even when no pillar has written for a while
+            asyncio.create_task(run_periodically("Group commit", COMMIT_INTERVAL, maybe_commit, conn)),
+
+            # --- Reporting Scheduling (Hourly, Daily, Weekly) ---
+
+            # 1. Hourly Report (Last 60 minutes) - Runs every hour
+            asyncio.create_task(run_periodically("Hourly report", REPORT_HOURLY_INTERVAL,
+                                                 render_report_in_worker, report_executor, conn, WINDOW_HOURLY, "Hourly",
+                                                 initial_delay=seconds_until_due(last_report_runs, "Hourly", REPORT_HOURLY_INTERVAL))),
+            # 2. Daily Report (Last 24 hours) - Runs every 12 hours
+            asyncio.create_task(run_periodically("Daily report", REPORT_DAILY_INTERVAL,
+                                                 render_report_in_worker, report_executor, conn, WINDOW_DAILY, "Daily",
+                                                 initial_delay=seconds_until_due(last_report_runs, "Daily", REPORT_DAILY_INTERVAL))),
+            # 3. Weekly Report (Last 7 days) - Runs once a day
+            asyncio.create_task(run_periodically("Weekly report", REPORT_WEEKLY_INTERVAL,
+                                                 render_report_in_worker, report_executor, conn, WINDOW_WEEKLY, "Weekly",
+                                                 initial_delay=seconds_until_due(last_report_runs, "Weekly", REPORT_WEEKLY_INTERVAL))),
+        ]
+
+        await asyncio.gather(*tasks)
 
-    except KeyboardInterrupt:
-        logging.info("Script interrupted by user. Shutting down.")
+    except Exception as e:
+        logging.critical(f"A critical unhandled error occurred: {e}. Exiting script.")
     
     finally:
+        for task in tasks:
+            task.cancel()
+        report_executor.shutdown(wait=False, cancel_futures=True)
+        await reddit.close()
         if conn:
-            logging.info("Closing database connection.")
+            logging.info("Committing pending writes and closing database connection.")
+            maybe_commit(conn, force=True)
             conn.close()
 
 
@@ -506,12 +899,14 @@ if __name__ == "__main__":
     
     # Step 1: Initialize resources
     initialize_db()
-    reddit = get_reddit_instance()
     
     # Load the filter list once
     load_allowed_tickers(TICKER_FILTER_FILE)
     
-    # Step 2: Start the continuous loop
-    main_loop(reddit)
+    # Step 2: Start the concurrent pillars (the Reddit client is created inside the event loop)
+    try:
+        asyncio.run(main_loop())
+    except KeyboardInterrupt:
+        logging.info("Script interrupted by user. Shutting down.")
 
     print("--- Script has terminated. ---")